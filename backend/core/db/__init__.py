@@ -86,6 +86,9 @@ class DatabaseManager:
             conn = sqlite3.connect(str(self.db_path))
             cursor = conn.cursor()
 
+            # WAL lets repository reads proceed while another connection writes
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Create all tables
             for table_sql in schema.ALL_TABLES:
                 cursor.execute(table_sql)
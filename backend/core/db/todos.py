@@ -2,10 +2,15 @@
 Todos Repository - Handles all todo-related database operations
 """
 
+import asyncio
 import json
+import sqlite3
+from collections import deque
+from contextvars import Context
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from core.logger import get_logger
 
@@ -13,12 +18,146 @@ from .base import BaseRepository
 
 logger = get_logger(__name__)
 
+# Stay well below SQLite's default 999 bound-parameter limit
+_DELETE_BATCH_CHUNK_SIZE = 500
+
+# Rows soft-deleted per transaction by range cleanups
+_DRIP_DELETE_BATCH_SIZE = 500
+
+# Pending frontend events that trigger an inline flush instead of waiting for the worker
+_EVENT_QUEUE_SIZE = 1024
+
+# Column order must match _TodoRow field order
+_TODO_COLUMNS = """
+    id, title, description, keywords,
+    created_at, completed, deleted, scheduled_date, scheduled_time,
+    scheduled_end_time, recurrence_rule
+"""
+
+
+@dataclass(slots=True)
+class _TodoRow:
+    """Lightweight row mirroring _TODO_COLUMNS"""
+
+    id: str
+    title: str
+    description: str
+    keywords: Optional[str]
+    created_at: str
+    completed: int
+    deleted: int
+    scheduled_date: Optional[str]
+    scheduled_time: Optional[str]
+    scheduled_end_time: Optional[str]
+    recurrence_rule: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the todo dict shape returned to callers"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "keywords": json.loads(self.keywords) if self.keywords else [],
+            "created_at": self.created_at,
+            "completed": bool(self.completed),
+            "deleted": bool(self.deleted),
+            "scheduled_date": self.scheduled_date,
+            "scheduled_time": self.scheduled_time,
+            "scheduled_end_time": self.scheduled_end_time,
+            "recurrence_rule": json.loads(self.recurrence_rule)
+            if self.recurrence_rule
+            else None,
+        }
+
+
+def _todo_row_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> _TodoRow:
+    """sqlite3 row factory building _TodoRow directly from the result tuple"""
+    return _TodoRow(*row)
+
 
 class TodosRepository(BaseRepository):
     """Repository for managing todos in the database"""
 
     def __init__(self, db_path: Path):
         super().__init__(db_path)
+        self._pending_events: Deque[Tuple[str, Any]] = deque()
+        self._events_ready: Optional[asyncio.Event] = None
+        self._event_worker: Optional[asyncio.Task] = None
+
+    def _queue_event(self, kind: str, data: Any) -> None:
+        """
+        Queue a todo event for the frontend without blocking the caller
+
+        Args:
+            kind: Event kind ("created", "updated" or "deleted")
+            data: Todo dict, or todo ID for "deleted"
+        """
+        self._pending_events.append((kind, data))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. offline scripts), emit inline
+            self._flush_events()
+            return
+
+        if len(self._pending_events) >= _EVENT_QUEUE_SIZE:
+            # Callers that never yield (e.g. a save loop) starve the worker,
+            # so drain inline instead of letting the queue grow unbounded
+            self._flush_events()
+            return
+
+        if self._event_worker is None or self._event_worker.done():
+            self._events_ready = asyncio.Event()
+            # Fresh context: the worker outlives the caller and must not
+            # inherit an event batch the caller may have open
+            self._event_worker = asyncio.create_task(
+                self._event_loop(self._events_ready), context=Context()
+            )
+        if self._events_ready is not None:
+            self._events_ready.set()
+
+    def _flush_events(self) -> None:
+        """Emit all pending todo events to the frontend"""
+        from core.events import (
+            BatchEmitter,
+            emit_todo_created,
+            emit_todo_deleted,
+            emit_todo_updated,
+        )
+
+        emitters = {
+            "created": emit_todo_created,
+            "updated": emit_todo_updated,
+            "deleted": emit_todo_deleted,
+        }
+        # A burst of queued events goes out as a single IPC call
+        with BatchEmitter():
+            while self._pending_events:
+                kind, data = self._pending_events.popleft()
+                try:
+                    emitters[kind](data)
+                except Exception as e:
+                    logger.error(f"Failed to emit todo {kind} event: {e}")
+
+    async def _event_loop(self, ready: asyncio.Event) -> None:
+        """Background task: drain queued todo events whenever signalled"""
+        while True:
+            self._flush_events()
+            ready.clear()
+            await ready.wait()
+
+    async def stop(self) -> None:
+        """Stop the event worker and emit any events still queued"""
+        worker, self._event_worker = self._event_worker, None
+        self._events_ready = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._flush_events()
 
     async def save(
         self,
@@ -63,9 +202,8 @@ class TodosRepository(BaseRepository):
                 logger.debug(f"Saved todo: {todo_id}")
 
                 # Send event to frontend
-                from core.events import emit_todo_created
-
-                emit_todo_created(
+                self._queue_event(
+                    "created",
                     {
                         "id": todo_id,
                         "title": title,
@@ -78,7 +216,7 @@ class TodosRepository(BaseRepository):
                         "recurrence_rule": recurrence_rule,
                         "created_at": created,
                         "type": "original",
-                    }
+                    },
                 )
         except Exception as e:
             logger.error(f"Failed to save todo {todo_id}: {e}", exc_info=True)
@@ -99,51 +237,26 @@ class TodosRepository(BaseRepository):
         """
         try:
             if include_completed:
-                query = """
-                    SELECT id, title, description, keywords,
-                           created_at, completed, deleted, scheduled_date, scheduled_time,
-                           scheduled_end_time, recurrence_rule
+                query = f"""
+                    SELECT {_TODO_COLUMNS}
                     FROM todos
                     WHERE deleted = 0
                     ORDER BY completed ASC, created_at DESC
                 """
             else:
-                query = """
-                    SELECT id, title, description, keywords,
-                           created_at, completed, deleted, scheduled_date, scheduled_time,
-                           scheduled_end_time, recurrence_rule
+                query = f"""
+                    SELECT {_TODO_COLUMNS}
                     FROM todos
                     WHERE deleted = 0 AND completed = 0
                     ORDER BY created_at DESC
                 """
 
             with self._get_conn() as conn:
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
-
-            todo_list: List[Dict[str, Any]] = []
-            for row in rows:
-                todo_list.append(
-                    {
-                        "id": row["id"],
-                        "title": row["title"],
-                        "description": row["description"],
-                        "keywords": json.loads(row["keywords"])
-                        if row["keywords"]
-                        else [],
-                        "created_at": row["created_at"],
-                        "completed": bool(row["completed"]),
-                        "deleted": bool(row["deleted"]),
-                        "scheduled_date": row["scheduled_date"],
-                        "scheduled_time": row["scheduled_time"],
-                        "scheduled_end_time": row["scheduled_end_time"],
-                        "recurrence_rule": json.loads(row["recurrence_rule"])
-                        if row["recurrence_rule"]
-                        else None,
-                    }
-                )
+                cursor = conn.cursor()
+                cursor.row_factory = _todo_row_factory
+                rows = cursor.execute(query).fetchall()
 
-            return todo_list
+            return [row.to_dict() for row in rows]
 
         except Exception as e:
             logger.error(f"Failed to get todo list: {e}", exc_info=True)
@@ -193,11 +306,10 @@ class TodosRepository(BaseRepository):
                 )
                 conn.commit()
 
+                cursor.row_factory = _todo_row_factory
                 cursor.execute(
-                    """
-                    SELECT id, title, description, keywords,
-                           created_at, completed, deleted, scheduled_date, scheduled_time,
-                           scheduled_end_time, recurrence_rule
+                    f"""
+                    SELECT {_TODO_COLUMNS}
                     FROM todos
                     WHERE id = ? AND deleted = 0
                     """,
@@ -206,28 +318,10 @@ class TodosRepository(BaseRepository):
                 row = cursor.fetchone()
 
                 if row:
-                    updated_todo = {
-                        "id": row["id"],
-                        "title": row["title"],
-                        "description": row["description"],
-                        "keywords": json.loads(row["keywords"])
-                        if row["keywords"]
-                        else [],
-                        "created_at": row["created_at"],
-                        "completed": bool(row["completed"]),
-                        "deleted": bool(row["deleted"]),
-                        "scheduled_date": row["scheduled_date"],
-                        "scheduled_time": row["scheduled_time"],
-                        "scheduled_end_time": row["scheduled_end_time"],
-                        "recurrence_rule": json.loads(row["recurrence_rule"])
-                        if row["recurrence_rule"]
-                        else None,
-                    }
+                    updated_todo = row.to_dict()
 
                     # Send event to frontend
-                    from core.events import emit_todo_updated
-
-                    emit_todo_updated(updated_todo)
+                    self._queue_event("updated", updated_todo)
 
                     return updated_todo
 
@@ -256,10 +350,10 @@ class TodosRepository(BaseRepository):
                 )
                 conn.commit()
 
+                cursor.row_factory = _todo_row_factory
                 cursor.execute(
-                    """
-                    SELECT id, title, description, keywords,
-                           created_at, completed, deleted, scheduled_date
+                    f"""
+                    SELECT {_TODO_COLUMNS}
                     FROM todos
                     WHERE id = ? AND deleted = 0
                     """,
@@ -268,23 +362,10 @@ class TodosRepository(BaseRepository):
                 row = cursor.fetchone()
 
                 if row:
-                    updated_todo = {
-                        "id": row["id"],
-                        "title": row["title"],
-                        "description": row["description"],
-                        "keywords": json.loads(row["keywords"])
-                        if row["keywords"]
-                        else [],
-                        "created_at": row["created_at"],
-                        "completed": bool(row["completed"]),
-                        "deleted": bool(row["deleted"]),
-                        "scheduled_date": row["scheduled_date"],
-                    }
+                    updated_todo = row.to_dict()
 
                     # Send event to frontend
-                    from core.events import emit_todo_updated
-
-                    emit_todo_updated(updated_todo)
+                    self._queue_event("updated", updated_todo)
 
                     return updated_todo
 
@@ -305,9 +386,7 @@ class TodosRepository(BaseRepository):
                 logger.debug(f"Deleted todo: {todo_id}")
 
                 # Send event to frontend
-                from core.events import emit_todo_deleted
-
-                emit_todo_deleted(todo_id)
+                self._queue_event("deleted", todo_id)
         except Exception as e:
             logger.error(f"Failed to delete todo {todo_id}: {e}", exc_info=True)
             raise
@@ -318,18 +397,24 @@ class TodosRepository(BaseRepository):
             return 0
 
         try:
-            placeholders = ",".join("?" for _ in todo_ids)
+            deleted_count = 0
             with self._get_conn() as conn:
-                cursor = conn.execute(
-                    f"""
-                    UPDATE todos
-                    SET deleted = 1
-                    WHERE deleted = 0 AND id IN ({placeholders})
-                    """,
-                    todo_ids,
-                )
+                # Fixed-size chunks keep us under SQLITE_MAX_VARIABLE_NUMBER and
+                # limit the number of distinct statements to compile
+                for start in range(0, len(todo_ids), _DELETE_BATCH_CHUNK_SIZE):
+                    chunk = todo_ids[start : start + _DELETE_BATCH_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"""
+                        UPDATE todos
+                        SET deleted = 1
+                        WHERE deleted = 0 AND id IN ({placeholders})
+                        """,
+                        chunk,
+                    )
+                    deleted_count += cursor.rowcount
                 conn.commit()
-                return cursor.rowcount
+                return deleted_count
 
         except Exception as e:
             logger.error(f"Failed to batch delete todos: {e}", exc_info=True)
@@ -338,19 +423,30 @@ class TodosRepository(BaseRepository):
     async def delete_by_date_range(self, start_iso: str, end_iso: str) -> int:
         """Soft delete todos in a time window"""
         try:
+            deleted_count = 0
             with self._get_conn() as conn:
-                cursor = conn.execute(
-                    """
-                    UPDATE todos
-                    SET deleted = 1
-                    WHERE deleted = 0
-                      AND created_at >= ?
-                      AND created_at <= ?
-                    """,
-                    (start_iso, end_iso),
-                )
-                deleted_count = cursor.rowcount
-                conn.commit()
+                # Drip-delete in small transactions so a large cleanup does not
+                # produce one big WAL delta that stalls readers at checkpoint
+                while True:
+                    cursor = conn.execute(
+                        """
+                        UPDATE todos
+                        SET deleted = 1
+                        WHERE rowid IN (
+                            SELECT rowid FROM todos
+                            WHERE deleted = 0
+                              AND created_at >= ?
+                              AND created_at <= ?
+                            LIMIT ?
+                        )
+                        """,
+                        (start_iso, end_iso, _DRIP_DELETE_BATCH_SIZE),
+                    )
+                    conn.commit()
+                    if cursor.rowcount <= 0:
+                        break
+                    deleted_count += cursor.rowcount
+                    await asyncio.sleep(0)
 
             return deleted_count
 
@@ -3,28 +3,157 @@ Tauri event sending manager
 Used to send event notifications from backend to frontend
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import time
+from contextvars import Context, ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from pydantic import TypeAdapter
 
-from pydantic import RootModel
-
-try:
-    from pytauri import AppHandle, Emitter
-except ImportError:  # pragma: no cover - May not be available in non-Tauri environments (like offline scripts, tests)
-    AppHandle = Any  # type: ignore[assignment]
-    Emitter = None  # type: ignore[assignment]
 from core._event_state import event_state
 from core.logger import get_logger
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from pytauri import AppHandle
 
+logger = get_logger(__name__)
 
-class _RawEventPayload(RootModel[Dict[str, Any]]):
-    """Wraps event payload for JSON serialization through PyTauri."""
+# Event names sent to the frontend
+_EVT_ACTIVITY_CREATED: Final[str] = "activity-created"
+_EVT_ACTIVITY_UPDATED: Final[str] = "activity-updated"
+_EVT_ACTIVITY_DELETED: Final[str] = "activity-deleted"
+_EVT_EVENT_DELETED: Final[str] = "event-deleted"
+_EVT_BULK_UPDATE_COMPLETED: Final[str] = "bulk-update-completed"
+_EVT_MONITORS_CHANGED: Final[str] = "monitors-changed"
+_EVT_AGENT_TASK_UPDATE: Final[str] = "agent-task-update"
+_EVT_CHAT_MESSAGE_CHUNK: Final[str] = "chat-message-chunk"
+_EVT_ACTIVITY_MERGED: Final[str] = "activity-merged"
+_EVT_ACTIVITY_SPLIT: Final[str] = "activity-split"
+_EVT_KNOWLEDGE_CREATED: Final[str] = "knowledge-created"
+_EVT_KNOWLEDGE_UPDATED: Final[str] = "knowledge-updated"
+_EVT_KNOWLEDGE_DELETED: Final[str] = "knowledge-deleted"
+_EVT_TODO_CREATED: Final[str] = "todo-created"
+_EVT_TODO_UPDATED: Final[str] = "todo-updated"
+_EVT_TODO_DELETED: Final[str] = "todo-deleted"
+_EVT_EVENTS_BATCH: Final[str] = "events-batch"
+
+# Payload "type" values
+_TYPE_ACTIVITY_CREATED: Final[str] = "activity_created"
+_TYPE_ACTIVITY_UPDATED: Final[str] = "activity_updated"
+_TYPE_ACTIVITY_DELETED: Final[str] = "activity_deleted"
+_TYPE_EVENT_DELETED: Final[str] = "event_deleted"
+_TYPE_BULK_UPDATE_COMPLETED: Final[str] = "bulk_update_completed"
+_TYPE_MONITORS_CHANGED: Final[str] = "monitors_changed"
+_TYPE_ACTIVITY_MERGED: Final[str] = "activity_merged"
+_TYPE_ACTIVITY_SPLIT: Final[str] = "activity_split"
+_TYPE_KNOWLEDGE_CREATED: Final[str] = "knowledge_created"
+_TYPE_KNOWLEDGE_UPDATED: Final[str] = "knowledge_updated"
+_TYPE_KNOWLEDGE_DELETED: Final[str] = "knowledge_deleted"
+_TYPE_TODO_CREATED: Final[str] = "todo_created"
+_TYPE_TODO_UPDATED: Final[str] = "todo_updated"
+_TYPE_TODO_DELETED: Final[str] = "todo_deleted"
+
+# Payload type -> frontend event name for envelope-style events
+_EMIT_SPECS: Final[Dict[str, str]] = {
+    _TYPE_ACTIVITY_CREATED: _EVT_ACTIVITY_CREATED,
+    _TYPE_ACTIVITY_UPDATED: _EVT_ACTIVITY_UPDATED,
+    _TYPE_ACTIVITY_DELETED: _EVT_ACTIVITY_DELETED,
+    _TYPE_EVENT_DELETED: _EVT_EVENT_DELETED,
+    _TYPE_BULK_UPDATE_COMPLETED: _EVT_BULK_UPDATE_COMPLETED,
+    _TYPE_MONITORS_CHANGED: _EVT_MONITORS_CHANGED,
+    _TYPE_ACTIVITY_MERGED: _EVT_ACTIVITY_MERGED,
+    _TYPE_ACTIVITY_SPLIT: _EVT_ACTIVITY_SPLIT,
+    _TYPE_KNOWLEDGE_CREATED: _EVT_KNOWLEDGE_CREATED,
+    _TYPE_KNOWLEDGE_UPDATED: _EVT_KNOWLEDGE_UPDATED,
+    _TYPE_KNOWLEDGE_DELETED: _EVT_KNOWLEDGE_DELETED,
+    _TYPE_TODO_CREATED: _EVT_TODO_CREATED,
+    _TYPE_TODO_UPDATED: _EVT_TODO_UPDATED,
+    _TYPE_TODO_DELETED: _EVT_TODO_DELETED,
+}
+
+# Events collected by the active BatchEmitter of the current context, if any
+_batch_buffer: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "_batch_buffer", default=None
+)
+
+# Streaming chat chunks are coalesced per conversation and flushed on a
+# short timer or once the buffered text grows past the size threshold
+_CHAT_CHUNK_FLUSH_INTERVAL = 0.016
+_CHAT_CHUNK_FLUSH_SIZE = 4096
+_chat_chunk_buffers: Dict[str, List[str]] = {}
+_chat_chunk_buffer_sizes: Dict[str, int] = {}
+_chat_chunk_flush_handles: Dict[str, asyncio.TimerHandle] = {}
+
+# Default timestamps are reused within this window (seconds) for bulk emits
+_NOW_ISO_TTL = 0.001
+_now_iso_cache: List[Any] = [0.0, ""]
+
+# Minimum seconds between logs of the same error for the same event
+_EMIT_ERROR_LOG_INTERVAL = 1.0
+_EMIT_ERROR_LOG_MAX_KEYS = 256
+_emit_error_log_times: Dict[Tuple[str, type, str], float] = {}
+# (exception type, message) of the last failure, cleared on success
+_last_emit_error: Optional[Tuple[type, str]] = None
+
+# Payload serializer, built once at import time
+_PAYLOAD_ADAPTER = TypeAdapter(Any)
+
+
+@dataclass(slots=True, frozen=True)
+class _EventEnvelope:
+    """Standard {type, data, timestamp} event payload."""
+
+    type: str
+    data: Any
+    timestamp: Optional[str]
+
+
+def _now_iso() -> str:
+    """Current time in ISO format, reused for bursts within one millisecond."""
+    now = time.monotonic()
+    if now - _now_iso_cache[0] > _NOW_ISO_TTL or not _now_iso_cache[1]:
+        _now_iso_cache[0] = now
+        _now_iso_cache[1] = datetime.now().isoformat()
+    return _now_iso_cache[1]
+
+
+def _dump_payload(payload: Any) -> str:
+    """Serialize event payload to a JSON string for PyTauri."""
+    return _PAYLOAD_ADAPTER.dump_json(payload).decode()
+
+
+@functools.cache
+def _get_emitter() -> Optional[Any]:
+    """
+    Import PyTauri's Emitter on first use
+
+    Deferred so processes that never register an AppHandle (offline scripts,
+    tests) do not load the PyTauri extension.
+    """
+    try:
+        from pytauri import Emitter
+    except ImportError:  # pragma: no cover - May not be available in non-Tauri environments (like offline scripts, tests)
+        return None
+    return Emitter
 
 
-def register_emit_handler(app_handle: AppHandle):
+def register_emit_handler(app_handle: "AppHandle"):
     """Register Tauri AppHandle for sending events through PyTauri Emitter."""
-    if Emitter is None:
+    if _get_emitter() is None:
         logger.warning(
             "PyTauri not installed, event notification functionality unavailable"
         )
@@ -34,34 +163,263 @@ def register_emit_handler(app_handle: AppHandle):
     logger.debug("Registered Tauri AppHandle for event sending")
 
 
-def _emit(event_name: str, payload: Dict[str, Any]) -> bool:
+def _is_enabled() -> bool:
+    """Whether events can currently be delivered to the frontend."""
+    # A handle is only registered once PyTauri is known to be importable
+    return event_state.app_handle is not None
+
+
+def _is_batching() -> bool:
+    """Whether emits are currently queued by a BatchEmitter instead of sent."""
+    return _batch_buffer.get() is not None
+
+
+def _emit(event_name: str, payload: Any) -> bool:
     """Send events to frontend through PyTauri."""
-    if Emitter is None:
-        logger.debug(
-            f"[events] PyTauri Emitter unavailable, skipping event sending: {event_name}"
+    app_handle = event_state.app_handle
+    if app_handle is None:
+        logger.warning(
+            "[events] AppHandle not registered, cannot send event: %s",
+            event_name,
         )
         return False
 
-    if event_state.app_handle is None:
-        logger.warning(
-            f"[events] AppHandle not registered, cannot send event: {event_name}"
+    emitter = _get_emitter()
+    if emitter is None:
+        logger.debug(
+            "[events] PyTauri Emitter unavailable, skipping event sending: %s",
+            event_name,
         )
         return False
 
+    batch = _batch_buffer.get()
+    if batch is not None:
+        batch.append({"event": event_name, "payload": payload})
+        return True
+
+    global _last_emit_error
+
     try:
-        Emitter.emit(event_state.app_handle, event_name, _RawEventPayload(payload))
+        emitter.emit_str(app_handle, event_name, _dump_payload(payload))
+        if _last_emit_error is not None:
+            _last_emit_error = None
+            _emit_error_log_times.clear()
         return True
     except Exception as exc:  # pragma: no cover - runtime exception logging
-        logger.error(f"❌ [events] Event sending failed: {event_name} : {exc}", exc_info=True)
+        # A new error is always logged; an error identical to the previous
+        # one (e.g. handle invalidated during shutdown) is logged without
+        # traceback and at most once per interval for the same event
+        error_key = (type(exc), str(exc))
+        log_key = (event_name, *error_key)
+        now = time.monotonic()
+        is_repeat = error_key == _last_emit_error
+        if is_repeat:
+            last_logged = _emit_error_log_times.get(log_key)
+            if last_logged is not None and now - last_logged < _EMIT_ERROR_LOG_INTERVAL:
+                return False
+
+        if len(_emit_error_log_times) >= _EMIT_ERROR_LOG_MAX_KEYS:
+            _emit_error_log_times.clear()
+        _emit_error_log_times[log_key] = now
+        if is_repeat:
+            logger.error("❌ [events] Event sending failed (repeat): %s", event_name)
+        else:
+            _last_emit_error = error_key
+            logger.error(
+                "❌ [events] Event sending failed: %s : %s",
+                event_name,
+                exc,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
         return False
 
 
-def emit_activity_created(activity_data: Dict[str, Any]) -> bool:
+class BatchEmitter:
+    """
+    Collect events emitted inside the block and send them as one IPC call
+
+    Multiple events are delivered as a single "events-batch" event with
+    payload {"events": [{"event": name, "payload": payload}, ...]}, which the
+    frontend demultiplexes to the regular listeners. The buffer lives in a
+    ContextVar, so concurrent tasks do not share batches.
+
+    Inside the block emitters only queue their event and return True; the
+    delivery result is available as `sent` once the block exits.
+
+    Example:
+        with BatchEmitter() as batch:
+            for activity in updated_activities:
+                emit_activity_updated(activity)
+        if not batch.sent:
+            ...
+    """
+
+    def __init__(self):
+        self._events: List[Dict[str, Any]] = []
+        self._token = None
+        self.sent: Optional[bool] = None
+
+    def __enter__(self) -> "BatchEmitter":
+        self._events = []
+        self.sent = None
+        self._token = _batch_buffer.set(self._events)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is not None:
+            _batch_buffer.reset(self._token)
+            self._token = None
+
+        self.sent = _send_batch(self._events)
+        self._events = []
+
+
+def _send_batch(entries: List[Dict[str, Any]]) -> bool:
+    """Send collected {event, payload} entries as one IPC call."""
+    if not entries:
+        return True
+
+    # Nested batches are merged into the enclosing one
+    batch = _batch_buffer.get()
+    if batch is not None:
+        batch.extend(entries)
+        return True
+
+    if len(entries) == 1:
+        success = _emit(entries[0]["event"], entries[0]["payload"])
+    else:
+        success = _emit(_EVT_EVENTS_BATCH, {"events": entries})
+    if success:
+        logger.debug("✅ [events] Batch sent: %d event(s)", len(entries))
+    return success
+
+
+def emit_many(events: List[Tuple[str, Any]]) -> bool:
+    """
+    Send several events to frontend in a single IPC call
+
+    Args:
+        events: List of (event name, payload) tuples
+
+    Returns:
+        True if sent successfully, False otherwise
+    """
+    if not _is_enabled():
+        return False
+
+    return _send_batch(
+        [{"event": event_name, "payload": payload} for event_name, payload in events]
+    )
+
+
+def _emit_typed(
+    event_type: str,
+    data: Any,
+    timestamp: Optional[str],
+    log_fmt: str,
+    *log_args: Any,
+) -> bool:
+    """
+    Send a {type, data, timestamp} event using the _EMIT_SPECS table
+
+    Args:
+        event_type: Payload type, key of _EMIT_SPECS
+        data: Event data
+        timestamp: Envelope timestamp
+        log_fmt: %-style detail appended to the debug log on success
+        *log_args: Arguments for log_fmt
+    """
+    event_name = _EMIT_SPECS[event_type]
+    success = _emit(event_name, _EventEnvelope(event_type, data, timestamp))
+    if success and not _is_batching():
+        logger.debug("✅ [events] %s event sent: " + log_fmt, event_name, *log_args)
+    return success
+
+
+def _make_data_emitter(
+    event_type: str,
+    timestamp_key: str,
+    default_now: bool = False,
+    doc: Optional[str] = None,
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build an emitter whose payload data is the record dict itself
+
+    Event name and type are resolved once here and captured in the closure,
+    so each call only builds the envelope.
+
+    Args:
+        event_type: Payload type, key of _EMIT_SPECS
+        timestamp_key: Record field used as the envelope timestamp
+        default_now: Fall back to the current time when the field is empty
+        doc: Docstring of the generated emitter
+    """
+    event_name = _EMIT_SPECS[event_type]
+
+    def emit(data: Dict[str, Any]) -> bool:
+        if not _is_enabled():
+            return False
+
+        timestamp = data.get(timestamp_key)
+        if default_now and not timestamp:
+            timestamp = _now_iso()
+
+        success = _emit(event_name, _EventEnvelope(event_type, data, timestamp))
+        if success and not _is_batching() and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ [events] %s event sent: %s", event_name, data.get("id"))
+        return success
+
+    emit.__name__ = emit.__qualname__ = f"emit_{event_type}"
+    emit.__doc__ = doc
+    return emit
+
+
+class _DeletedEmitter(Protocol):
+    """Signature of the generated emit_*_deleted functions."""
+
+    def __call__(self, item_id: str, timestamp: Optional[str] = None) -> bool: ...
+
+
+def _make_deleted_emitter(
+    event_type: str, doc: Optional[str] = None
+) -> _DeletedEmitter:
+    """
+    Build an emitter for {"id", "deletedAt"} deletion events
+
+    Args:
+        event_type: Payload type, key of _EMIT_SPECS
+        doc: Docstring of the generated emitter
     """
+    event_name = _EMIT_SPECS[event_type]
+
+    def emit(item_id: str, timestamp: Optional[str] = None) -> bool:
+        if not _is_enabled():
+            return False
+
+        resolved_timestamp = timestamp if timestamp is not None else _now_iso()
+        payload = _EventEnvelope(
+            event_type,
+            {"id": item_id, "deletedAt": resolved_timestamp},
+            resolved_timestamp,
+        )
+        success = _emit(event_name, payload)
+        if success and not _is_batching():
+            logger.debug("✅ [events] %s event sent: %s", event_name, item_id)
+        return success
+
+    emit.__name__ = emit.__qualname__ = f"emit_{event_type}"
+    emit.__doc__ = doc
+    return emit
+
+
+emit_activity_created = _make_data_emitter(
+    _TYPE_ACTIVITY_CREATED,
+    timestamp_key="createdAt",
+    doc="""
     Send "activity created" event to frontend
 
     Args:
-        activity_data: Activity data dictionary, containing:
+        data: Activity data dictionary, containing:
             - id: Activity ID
             - description: Activity description
             - startTime: Start time
@@ -71,32 +429,18 @@ def emit_activity_created(activity_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    logger.debug(
-        "[emit_activity_created] Attempting to send activity creation event, AppHandle registered: %s",
-        event_state.app_handle is not None,
-    )
+    """,
+)
 
-    payload = {
-        "type": "activity_created",
-        "data": activity_data,
-        "timestamp": activity_data.get("createdAt"),
-    }
 
-    success = _emit("activity-created", payload)
-    if success:
-        logger.debug(
-            f"✅ [emit_activity_created] Successfully sent activity creation event: {activity_data.get('id')}"
-        )
-    return success
-
-
-def emit_activity_updated(activity_data: Dict[str, Any]) -> bool:
-    """
+emit_activity_updated = _make_data_emitter(
+    _TYPE_ACTIVITY_UPDATED,
+    timestamp_key="createdAt",
+    doc="""
     Send "activity updated" event to frontend
 
     Args:
-        activity_data: Updated activity data, should contain:
+        data: Updated activity data, should contain:
             - id: Activity ID
             - description: Activity description
             - startTime: Start time
@@ -106,69 +450,38 @@ def emit_activity_updated(activity_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    payload = {
-        "type": "activity_updated",
-        "data": activity_data,
-        "timestamp": activity_data.get("createdAt"),
-    }
-
-    success = _emit("activity-updated", payload)
-    if success:
-        logger.debug(f"✅ Activity update event sent: {activity_data.get('id')}")
-    return success
+    """,
+)
 
 
-def emit_activity_deleted(activity_id: str, timestamp: Optional[str] = None) -> bool:
-    """
+emit_activity_deleted = _make_deleted_emitter(
+    _TYPE_ACTIVITY_DELETED,
+    doc="""
     Send "activity deleted" event to frontend
 
     Args:
-        activity_id: ID of the deleted activity
+        item_id: ID of the deleted activity
         timestamp: Deletion timestamp
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "activity_deleted",
-        "data": {"id": activity_id, "deletedAt": resolved_timestamp},
-        "timestamp": resolved_timestamp,
-    }
-
-    success = _emit("activity-deleted", payload)
-    if success:
-        logger.debug(f"✅ Activity deletion event sent: {activity_id}")
-    return success
+    """,
+)
 
 
-def emit_event_deleted(event_id: str, timestamp: Optional[str] = None) -> bool:
-    """
+emit_event_deleted = _make_deleted_emitter(
+    _TYPE_EVENT_DELETED,
+    doc="""
     Send "event deleted" event to frontend
 
     Args:
-        event_id: ID of the deleted event
+        item_id: ID of the deleted event
         timestamp: Deletion timestamp
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "event_deleted",
-        "data": {"id": event_id, "deletedAt": resolved_timestamp},
-        "timestamp": resolved_timestamp,
-    }
-
-    success = _emit("event-deleted", payload)
-    if success:
-        logger.debug(f"✅ Event deletion event sent: {event_id}")
-    return success
+    """,
+)
 
 
 def emit_bulk_update_completed(
@@ -185,21 +498,17 @@ def emit_bulk_update_completed(
     Returns:
         True if sent successfully, False otherwise
     """
-    from datetime import datetime
-
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "bulk_update_completed",
-        "data": {"updatedCount": updated_count, "timestamp": resolved_timestamp},
-        "timestamp": resolved_timestamp,
-    }
+    if not _is_enabled():
+        return False
 
-    success = _emit("bulk-update-completed", payload)
-    if success:
-        logger.debug(
-            f"✅ Bulk update completion event sent: {updated_count} activities"
-        )
-    return success
+    resolved_timestamp = timestamp if timestamp is not None else _now_iso()
+    return _emit_typed(
+        _TYPE_BULK_UPDATE_COMPLETED,
+        {"updatedCount": updated_count, "timestamp": resolved_timestamp},
+        resolved_timestamp,
+        "%s activities",
+        updated_count,
+    )
 
 
 def emit_monitors_changed(
@@ -208,18 +517,18 @@ def emit_monitors_changed(
     """
     Send \"monitors changed\" event to frontend when connected displays change.
     """
-    from datetime import datetime
+    if not _is_enabled():
+        return False
 
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "monitors_changed",
-        "data": {"monitors": monitors, "count": len(monitors)},
-        "timestamp": resolved_timestamp,
-    }
-    success = _emit("monitors-changed", payload)
-    if success:
-        logger.debug("✅ Monitors changed event sent")
-    return success
+    count = len(monitors)
+    resolved_timestamp = timestamp if timestamp is not None else _now_iso()
+    return _emit_typed(
+        _TYPE_MONITORS_CHANGED,
+        {"monitors": monitors, "count": count},
+        resolved_timestamp,
+        "%s monitor(s)",
+        count,
+    )
 
 
 def emit_agent_task_update(
@@ -228,7 +537,6 @@ def emit_agent_task_update(
     progress: Optional[Dict[str, Any]] = None,
     result: Optional[Dict[str, Any]] = None,
     error: Optional[str] = None,
-    timestamp: Optional[str] = None,
 ) -> bool:
     """
     Send "Agent task update" event to frontend
@@ -243,6 +551,9 @@ def emit_agent_task_update(
     Returns:
         True if sent successfully, False otherwise
     """
+    if not _is_enabled():
+        return False
+
     payload = {
         "taskId": task_id,
         "status": status,
@@ -255,9 +566,9 @@ def emit_agent_task_update(
     if error is not None:
         payload["error"] = error
 
-    success = _emit("agent-task-update", payload)
-    if success:
-        logger.debug(f"✅ Agent task update event sent: {task_id} -> {status}")
+    success = _emit(_EVT_AGENT_TASK_UPDATE, payload)
+    if success and not _is_batching():
+        logger.debug("✅ Agent task update event sent: %s -> %s", task_id, status)
     return success
 
 
@@ -266,11 +577,13 @@ def emit_chat_message_chunk(
     chunk: str,
     done: bool = False,
     message_id: Optional[str] = None,
-    timestamp: Optional[str] = None,
 ) -> bool:
     """
     Send "chat message chunk" event to frontend (for streaming output)
 
+    Non-final chunks are buffered and coalesced per conversation; a final
+    chunk (done=True) flushes the buffer before the completion event.
+
     Args:
         conversation_id: Conversation ID
         chunk: Text chunk content
@@ -280,6 +593,38 @@ def emit_chat_message_chunk(
     Returns:
         True if sent successfully, False otherwise
     """
+    if not _is_enabled():
+        return False
+
+    if not done:
+        buffer = _chat_chunk_buffers.setdefault(conversation_id, [])
+        buffer.append(chunk)
+        buffered_size = _chat_chunk_buffer_sizes.get(conversation_id, 0) + len(chunk)
+        _chat_chunk_buffer_sizes[conversation_id] = buffered_size
+
+        if buffered_size >= _CHAT_CHUNK_FLUSH_SIZE:
+            return _flush_chat_chunks(conversation_id)
+
+        if conversation_id not in _chat_chunk_flush_handles:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to schedule the flush on, send immediately
+                return _flush_chat_chunks(conversation_id)
+            # Run the flush in a fresh context so it never lands in a
+            # BatchEmitter that has already exited
+            _chat_chunk_flush_handles[conversation_id] = loop.call_later(
+                _CHAT_CHUNK_FLUSH_INTERVAL,
+                _flush_chat_chunks,
+                conversation_id,
+                context=Context(),
+            )
+        return True
+
+    # Deliver buffered text before the completion signal, the frontend
+    # ignores the chunk of a done event
+    _flush_chat_chunks(conversation_id)
+
     payload = {
         "conversationId": conversation_id,
         "chunk": chunk,
@@ -289,12 +634,30 @@ def emit_chat_message_chunk(
     if message_id is not None:
         payload["messageId"] = message_id
 
-    success = _emit("chat-message-chunk", payload)
-    if success and done:
-        logger.debug(f"✅ Chat message completion event sent: {conversation_id}")
+    success = _emit(_EVT_CHAT_MESSAGE_CHUNK, payload)
+    if success and not _is_batching():
+        logger.debug("✅ Chat message completion event sent: %s", conversation_id)
     return success
 
 
+def _flush_chat_chunks(conversation_id: str) -> bool:
+    """Send buffered streaming chunks of a conversation as a single event."""
+    handle = _chat_chunk_flush_handles.pop(conversation_id, None)
+    if handle is not None:
+        handle.cancel()
+    _chat_chunk_buffer_sizes.pop(conversation_id, None)
+    chunks = _chat_chunk_buffers.pop(conversation_id, None)
+    if not chunks:
+        return True
+
+    payload = {
+        "conversationId": conversation_id,
+        "chunk": "".join(chunks),
+        "done": False,
+    }
+    return _emit(_EVT_CHAT_MESSAGE_CHUNK, payload)
+
+
 def emit_activity_merged(
     merged_activity_id: str,
     original_activity_ids: List[str],
@@ -311,24 +674,21 @@ def emit_activity_merged(
     Returns:
         True if sent successfully, False otherwise
     """
-    from datetime import datetime
+    if not _is_enabled():
+        return False
 
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "activity_merged",
-        "data": {
+    resolved_timestamp = timestamp if timestamp is not None else _now_iso()
+    return _emit_typed(
+        _TYPE_ACTIVITY_MERGED,
+        {
             "merged_activity_id": merged_activity_id,
             "original_activity_ids": original_activity_ids,
         },
-        "timestamp": resolved_timestamp,
-    }
-
-    success = _emit("activity-merged", payload)
-    if success:
-        logger.debug(
-            f"✅ Activity merge event sent: {len(original_activity_ids)} -> {merged_activity_id}"
-        )
-    return success
+        resolved_timestamp,
+        "%s -> %s",
+        len(original_activity_ids),
+        merged_activity_id,
+    )
 
 
 def emit_activity_split(
@@ -347,32 +707,32 @@ def emit_activity_split(
     Returns:
         True if sent successfully, False otherwise
     """
-    from datetime import datetime
+    if not _is_enabled():
+        return False
 
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "activity_split",
-        "data": {
+    resolved_timestamp = timestamp if timestamp is not None else _now_iso()
+    return _emit_typed(
+        _TYPE_ACTIVITY_SPLIT,
+        {
             "original_activity_id": original_activity_id,
             "new_activity_ids": new_activity_ids,
         },
-        "timestamp": resolved_timestamp,
-    }
-
-    success = _emit("activity-split", payload)
-    if success:
-        logger.debug(
-            f"✅ Activity split event sent: {original_activity_id} -> {len(new_activity_ids)}"
-        )
-    return success
+        resolved_timestamp,
+        "%s -> %s",
+        original_activity_id,
+        len(new_activity_ids),
+    )
 
 
-def emit_knowledge_created(knowledge_data: Dict[str, Any]) -> bool:
-    """
+emit_knowledge_created = _make_data_emitter(
+    _TYPE_KNOWLEDGE_CREATED,
+    timestamp_key="created_at",
+    default_now=True,
+    doc="""
     Send "knowledge created" event to frontend
 
     Args:
-        knowledge_data: Knowledge data dictionary, containing:
+        data: Knowledge data dictionary, containing:
             - id: Knowledge ID
             - title: Knowledge title
             - description: Knowledge description
@@ -383,26 +743,19 @@ def emit_knowledge_created(knowledge_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    payload = {
-        "type": "knowledge_created",
-        "data": knowledge_data,
-        "timestamp": knowledge_data.get("created_at") or datetime.now().isoformat(),
-    }
-    success = _emit("knowledge-created", payload)
-    if success:
-        logger.debug(f"✅ Knowledge creation event sent: {knowledge_data.get('id')}")
-    return success
+    """,
+)
 
 
-def emit_knowledge_updated(knowledge_data: Dict[str, Any]) -> bool:
-    """
+emit_knowledge_updated = _make_data_emitter(
+    _TYPE_KNOWLEDGE_UPDATED,
+    timestamp_key="created_at",
+    default_now=True,
+    doc="""
     Send "knowledge updated" event to frontend
 
     Args:
-        knowledge_data: Updated knowledge data, should contain:
+        data: Updated knowledge data, should contain:
             - id: Knowledge ID
             - title: Knowledge title
             - description: Knowledge description
@@ -413,51 +766,34 @@ def emit_knowledge_updated(knowledge_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    payload = {
-        "type": "knowledge_updated",
-        "data": knowledge_data,
-        "timestamp": knowledge_data.get("created_at") or datetime.now().isoformat(),
-    }
-    success = _emit("knowledge-updated", payload)
-    if success:
-        logger.debug(f"✅ Knowledge update event sent: {knowledge_data.get('id')}")
-    return success
+    """,
+)
 
 
-def emit_knowledge_deleted(knowledge_id: str, timestamp: Optional[str] = None) -> bool:
-    """
+emit_knowledge_deleted = _make_deleted_emitter(
+    _TYPE_KNOWLEDGE_DELETED,
+    doc="""
     Send "knowledge deleted" event to frontend
 
     Args:
-        knowledge_id: ID of the deleted knowledge
+        item_id: ID of the deleted knowledge
         timestamp: Deletion timestamp
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "knowledge_deleted",
-        "data": {"id": knowledge_id, "deletedAt": resolved_timestamp},
-        "timestamp": resolved_timestamp,
-    }
-    success = _emit("knowledge-deleted", payload)
-    if success:
-        logger.debug(f"✅ Knowledge deletion event sent: {knowledge_id}")
-    return success
+    """,
+)
 
 
-def emit_todo_created(todo_data: Dict[str, Any]) -> bool:
-    """
+emit_todo_created = _make_data_emitter(
+    _TYPE_TODO_CREATED,
+    timestamp_key="created_at",
+    default_now=True,
+    doc="""
     Send "todo created" event to frontend
 
     Args:
-        todo_data: TODO data dictionary, containing:
+        data: TODO data dictionary, containing:
             - id: TODO ID
             - title: TODO title
             - description: TODO description
@@ -472,26 +808,19 @@ def emit_todo_created(todo_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
+    """,
+)
 
-    payload = {
-        "type": "todo_created",
-        "data": todo_data,
-        "timestamp": todo_data.get("created_at") or datetime.now().isoformat(),
-    }
-    success = _emit("todo-created", payload)
-    if success:
-        logger.debug(f"✅ TODO creation event sent: {todo_data.get('id')}")
-    return success
 
-
-def emit_todo_updated(todo_data: Dict[str, Any]) -> bool:
-    """
+emit_todo_updated = _make_data_emitter(
+    _TYPE_TODO_UPDATED,
+    timestamp_key="created_at",
+    default_now=True,
+    doc="""
     Send "todo updated" event to frontend
 
     Args:
-        todo_data: Updated TODO data, should contain:
+        data: Updated TODO data, should contain:
             - id: TODO ID
             - title: TODO title
             - description: TODO description
@@ -507,40 +836,20 @@ def emit_todo_updated(todo_data: Dict[str, Any]) -> bool:
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    payload = {
-        "type": "todo_updated",
-        "data": todo_data,
-        "timestamp": todo_data.get("created_at") or datetime.now().isoformat(),
-    }
-    success = _emit("todo-updated", payload)
-    if success:
-        logger.debug(f"✅ TODO update event sent: {todo_data.get('id')}")
-    return success
+    """,
+)
 
 
-def emit_todo_deleted(todo_id: str, timestamp: Optional[str] = None) -> bool:
-    """
+emit_todo_deleted = _make_deleted_emitter(
+    _TYPE_TODO_DELETED,
+    doc="""
     Send "todo deleted" event to frontend
 
     Args:
-        todo_id: ID of the deleted TODO
+        item_id: ID of the deleted TODO
         timestamp: Deletion timestamp
 
     Returns:
         True if sent successfully, False otherwise
-    """
-    from datetime import datetime
-
-    resolved_timestamp = timestamp or datetime.now().isoformat()
-    payload = {
-        "type": "todo_deleted",
-        "data": {"id": todo_id, "deletedAt": resolved_timestamp},
-        "timestamp": resolved_timestamp,
-    }
-    success = _emit("todo-deleted", payload)
-    if success:
-        logger.debug(f"✅ TODO deletion event sent: {todo_id}")
-    return success
+    """,
+)
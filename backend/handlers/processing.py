@@ -10,6 +10,7 @@ Handles processing pipeline control operations and batch data cleanup including:
 """
 
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 from core.coordinator import get_coordinator
@@ -78,10 +79,13 @@ def _calculate_persistence_stats(db: DatabaseManager, image_manager: Optional[Im
     try:
         stats: Dict[str, Any] = dict(db.get_table_counts())
 
-        try:
-            size_bytes = db.db_path.stat().st_size
-        except OSError:
-            size_bytes = 0
+        # In WAL mode recent commits live in the -wal file until checkpointed
+        size_bytes = 0
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                size_bytes += Path(f"{db.db_path}{suffix}").stat().st_size
+            except OSError:
+                pass
 
         stats["databasePath"] = str(db.db_path)
         stats["databaseSize"] = size_bytes
@@ -235,6 +235,15 @@ async def stop_runtime(*, quiet: bool = False) -> PipelineCoordinator:
         if not quiet:
             logger.error(f"Exception while stopping pipeline coordinator: {e}", exc_info=True)
 
+    # Flush queued todo events and stop their background worker
+    try:
+        from core.db import get_db
+
+        await get_db().todos.stop()
+    except Exception as e:
+        if not quiet:
+            logger.warning(f"Failed to stop todo event worker: {e}")
+
     if not quiet:
         logger.info("Pipeline coordinator stopped")
     return coordinator
@@ -2,6 +2,15 @@ import { useEffect, useRef } from 'react'
 
 import { isTauri } from '@/lib/utils/tauri'
 
+/**
+ * Batched events sent by the backend in a single IPC call
+ */
+const EVENTS_BATCH = 'events-batch'
+
+interface EventsBatchPayload {
+  events: Array<{ event: string; payload: unknown }>
+}
+
 /**
  * Hook for listening to Tauri events
  * Stores handlers in refs so changing callbacks does not re-register listeners
@@ -27,20 +36,35 @@ export function useTauriEvent<T = any>(eventName: string, handler: (payload: T)
       return
     }
 
-    let unlisten: (() => void) | undefined
+    const unlisteners: Array<() => void> = []
+    let disposed = false
 
     // Dynamically import the Tauri API
     import('@tauri-apps/api/event')
       .then(({ listen }) => {
         console.debug(`[useTauriEvent] Listening to event: ${eventName}`)
-        return listen<T>(eventName, (event) => {
-          console.debug(`[useTauriEvent] Received event: ${eventName}`, event.payload)
-          // Invoke the latest handler from the ref
-          handlerRef.current(event.payload)
-        })
+        return Promise.all([
+          listen<T>(eventName, (event) => {
+            console.debug(`[useTauriEvent] Received event: ${eventName}`, event.payload)
+            // Invoke the latest handler from the ref
+            handlerRef.current(event.payload)
+          }),
+          // The backend may coalesce several events into a single batch
+          listen<EventsBatchPayload>(EVENTS_BATCH, (event) => {
+            for (const entry of event.payload.events) {
+              if (entry.event === eventName) {
+                handlerRef.current(entry.payload as T)
+              }
+            }
+          })
+        ])
       })
-      .then((fn) => {
-        unlisten = fn
+      .then((fns) => {
+        if (disposed) {
+          fns.forEach((fn) => fn())
+          return
+        }
+        unlisteners.push(...fns)
         console.debug(`[useTauriEvent] ✅ Event listener registered: ${eventName}`)
       })
       .catch((error) => {
@@ -49,9 +73,10 @@ export function useTauriEvent<T = any>(eventName: string, handler: (payload: T)
 
     // Cleanup function
     return () => {
-      if (unlisten) {
+      disposed = true
+      if (unlisteners.length > 0) {
         console.debug(`[useTauriEvent] Unlistened event: ${eventName}`)
-        unlisten()
+        unlisteners.forEach((fn) => fn())
       }
     }
   }, [eventName])